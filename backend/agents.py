@@ -10,7 +10,6 @@ from concurrent.futures import ThreadPoolExecutor
 import threading
 
 from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, BaseMessage
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
@@ -136,6 +135,10 @@ class AgentState(TypedDict):
 
 def create_llm(temperature: float = 0.7):
     """Initialize Gemini model with rotating API key"""
+    # Imported here so the Google GenAI SDK (the heaviest dependency) only
+    # loads once an agent actually needs an LLM
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     # Get next API key in rotation
     api_key = api_key_rotator.get_next_key()
 
@@ -156,8 +159,9 @@ class DetectiveAgent:
     Uses parallel execution for speed
     """
 
-    def __init__(self, github_token: str, progress_callback=None):
-        self.client = GitHubAPIClient(github_token)
+    def __init__(self, github_token: str, progress_callback=None,
+                 session=None):
+        self.client = GitHubAPIClient(github_token, session=session)
         self.profile_detective = ProfileDetective(self.client)
         self.repo_stalker = RepositoryStalker(self.client)
         self.ex_readme = ExReadme(self.client)
@@ -165,6 +169,10 @@ class DetectiveAgent:
         self.llm = create_llm(temperature=0.3)  # Low temp for factual tasks
         self.progress_callback = progress_callback
 
+    def close(self):
+        """Release the GitHub client's HTTP connection pool"""
+        self.client.close()
+
     async def investigate_parallel(self, username: str) -> Dict[str, Any]:
         """
         Fetch data in parallel for maximum speed
@@ -1106,15 +1114,8 @@ class GhostwriterAgent:
 
     def __init__(self):
         """Initialize Ghostwriter with LLM for creative generation"""
-        # Get next API key in rotation
-        api_key = api_key_rotator.get_next_key()
-
         # Higher temperature for creative writing
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash",
-            temperature=0.7,
-            google_api_key=api_key,
-        )
+        self.llm = create_llm(temperature=0.7)
 
     def __call__(self, state: AgentState) -> AgentState:
         """
@@ -1684,10 +1685,11 @@ def route_next_step(state: AgentState) -> str:
 # GRAPH BUILDER
 # ============================================================
 
-def create_analysis_graph(progress_callback=None) -> StateGraph:
+def create_analysis_graph(progress_callback=None, session=None) -> StateGraph:
     """
     Create graph with only Detective and CTO agents
     Stops after analysis - Ghostwriter runs separately
+    Pass a requests.Session to control the Detective's connection pool
     """
     # Initialize memory for checkpointing
     memory = MemorySaver()
@@ -1700,7 +1702,7 @@ def create_analysis_graph(progress_callback=None) -> StateGraph:
         raise ValueError("GITHUB_PAT not found in environment variables")
 
     detective = DetectiveAgent(
-        GITHUB_TOKEN, progress_callback=progress_callback)
+        GITHUB_TOKEN, progress_callback=progress_callback, session=session)
     cto = CTOAgent(progress_callback=progress_callback)
 
     # Add nodes - NO Ghostwriter
@@ -1760,9 +1762,9 @@ def create_analysis_graph(progress_callback=None) -> StateGraph:
 
 
 # Keep the old function name for backward compatibility
-def create_detective_graph(progress_callback=None) -> StateGraph:
+def create_detective_graph(progress_callback=None, session=None) -> StateGraph:
     """Alias for create_analysis_graph"""
-    return create_analysis_graph(progress_callback)
+    return create_analysis_graph(progress_callback, session)
 
 
 # ============================================================
@@ -15,6 +15,7 @@ from fastapi import FastAPI, BackgroundTasks, HTTPException, Request
 from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+import requests
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -315,10 +316,13 @@ async def run_agent(session_id: str, username: str, tone: str, style: str):
 
         def run_graph_in_thread():
             """Run LangGraph in a separate thread and push events to queue"""
+            # The graph's Detective pools its GitHub connections in this
+            # session, so close it here rather than leave sockets to the GC
+            http_session = requests.Session()
             try:
                 print(f"🔧 Thread started: Creating LangGraph...")
                 app_graph = create_detective_graph(
-                    progress_callback=progress_callback)
+                    progress_callback=progress_callback, session=http_session)
                 initial_state = create_initial_state(
                     username,
                     preferences={"tone": tone, "style": style}
@@ -346,6 +350,8 @@ async def run_agent(session_id: str, username: str, tone: str, style: str):
                 import traceback
                 print(f"Thread traceback:\n{traceback.format_exc()}")
                 sync_queue.put(('error', str(e), None))
+            finally:
+                http_session.close()
 
         # Start the graph in a separate thread
         graph_thread = Thread(target=run_graph_in_thread, daemon=True)
@@ -4,11 +4,18 @@ Agentic AI system to generate awesome GitHub profile READMEs
 """
 
 import os
-import requests
-from typing import Dict, List, Optional, Any
+import sys
+import json
+import time
+import argparse
+import threading
+import contextlib
+from typing import Dict, List, Optional, Any, Tuple, TypedDict
 from datetime import datetime
 from dotenv import load_dotenv
 from collections import Counter
+from itertools import batched
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables
 load_dotenv()
@@ -16,20 +23,148 @@ load_dotenv()
 GITHUB_API_URL = "https://api.github.com/graphql"
 GITHUB_TOKEN = os.getenv("GITHUB_PAT")
 
+# How long (seconds) GitHub responses are reused before refetching. Off (0) by
+# default so the API server never serves a stale profile; opt in for batch runs
+# GraphQL is POST-only, so GitHub's ETag / If-None-Match revalidation doesn't apply
+CACHE_TTL = int(os.getenv("GITHUB_CACHE_TTL", "0"))
+CACHE_MAX_ENTRIES = 512
+
+# Shared by every client: (query, variables) -> (fetched_at, data)
+_response_cache: Dict[str, Tuple[float, Dict]] = {}
+_response_cache_lock = threading.Lock()
+
+
+# ============================================================
+# RESULT TYPES - shape of GitHubProfileAnalyzer.analyze_user()
+# ============================================================
+
+class ProfileInfo(TypedDict):
+    """Basic profile fields from ProfileDetective"""
+    name: Optional[str]
+    username: str
+    bio: Optional[str]
+    company: Optional[str]
+    location: Optional[str]
+    email: Optional[str]
+    website: Optional[str]
+    twitter: Optional[str]
+    avatar_url: str
+    created_at: str
+    is_hireable: bool
+    status: Optional[Dict[str, Any]]
+
+
+class ProfileStats(TypedDict):
+    """Follower/repository counts plus aggregates over the analyzed repos"""
+    followers: int
+    following: int
+    total_repos: int
+    pinned_count: int
+    readme_count: int
+    all_tech: List[str]
+    tech_count: int
+
+
+class ContributionAnalysis(TypedDict):
+    """Output of ContributionCalendar.analyze"""
+    current_streak: int
+    longest_streak: int
+    total_contributions: int
+    average_daily: float
+    active_days: int
+    most_productive_day: Dict[str, Any]
+    activity_rate: float
+
+
+class LanguageAnalysis(TypedDict):
+    """Output of LanguageAnalyzer.analyze"""
+    languages: Dict[str, Dict[str, Any]]
+    top_languages: List[Tuple[str, int]]
+    tech_stack: List[Tuple[str, int]]
+    total_languages: int
+
+
+class SkillSummary(TypedDict):
+    """Output of SkillExtractor.extract"""
+    all_skills: List[str]
+    frameworks: List[str]
+    tools: List[str]
+    total_unique_skills: int
+
+
+class SocialProof(TypedDict):
+    """Output of SocialProofCollector.collect"""
+    total_stars: int
+    total_forks: int
+    total_followers: int
+    total_repos: int
+    active_repos: int
+    original_repos: int
+    most_starred_repo: Optional[Dict[str, Any]]
+    average_stars_per_repo: float
+
+
+class ProfileAnalysis(TypedDict):
+    """Complete analysis returned by GitHubProfileAnalyzer.analyze_user"""
+    profile: ProfileInfo
+    stats: ProfileStats
+    contributions: ContributionAnalysis
+    repositories: List[Dict[str, Any]]
+    pinned_repos: List[Dict[str, Any]]
+    languages: LanguageAnalysis
+    skills: SkillSummary
+    social_proof: SocialProof
+    social_accounts: List[Dict[str, str]]
+    existing_readme: Optional[str]
+
 
 class GitHubAPIClient:
     """Base client for GitHub GraphQL API interactions"""
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, session=None):
+        # Imported here rather than at module top: requests is the bulk of
+        # this module's import time and isn't needed until a client exists
+        import requests
+
         self.token = token
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
+        # One keep-alive connection pool for every query; pass a
+        # requests.Session in to share it between clients
+        self._owns_session = session is None
+        self.session = session or requests.Session()
+
+    def close(self):
+        """Close the HTTP session if this client created it"""
+        if self._owns_session:
+            self.session.close()
 
     def execute_query(self, query: str, variables: Optional[Dict] = None) -> Dict:
-        """Execute a GraphQL query"""
-        response = requests.post(
+        """Execute a GraphQL query (served from cache while fresh, if enabled)"""
+        if CACHE_TTL <= 0:
+            return self._post_query(query, variables)
+
+        cache_key = json.dumps(
+            {"query": query, "variables": variables or {}}, sort_keys=True)
+        cached = _response_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < CACHE_TTL:
+            return cached[1]
+
+        data = self._post_query(query, variables)
+
+        with _response_cache_lock:
+            if len(_response_cache) >= CACHE_MAX_ENTRIES:
+                # Drop the oldest entry (dicts keep insertion order)
+                _response_cache.pop(next(iter(_response_cache)))
+            _response_cache[cache_key] = (time.monotonic(), data)
+
+        return data
+
+    def _post_query(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Send a GraphQL query to GitHub"""
+        response = self.session.post(
             GITHUB_API_URL,
             json={"query": query, "variables": variables or {}},
             headers=self.headers
@@ -445,6 +580,9 @@ class TechStackDetective:
         "Flutter": ["pubspec.yaml", ".dart"],
     }
 
+    # Max number of repositories fetched concurrently
+    MAX_WORKERS = 10
+
     def __init__(self, client: GitHubAPIClient):
         self.client = client
 
@@ -452,41 +590,46 @@ class TechStackDetective:
         """
         For each repository, fetch file tree and README content
         Detect tech stack from file patterns
+        Repositories are fetched concurrently, results keep the input order
         Returns enriched repository data
         """
         enriched_repos = []
 
-        for idx, repo in enumerate(repositories, 1):
-            msg = f"🔍 Investigating {repo['name']}... ({idx}/{len(repositories)})"
-            print(f"  {msg}")
-            if progress_callback:
-                progress_callback("detective", msg)
-
-            # Fetch repository file tree and README in one query
-            repo_data = self._fetch_repo_details(username, repo["name"])
-
-            # Detect tech stack from file patterns
-            detected_tech = self._detect_tech_stack(repo_data["files"])
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            # Fetch repository file trees and READMEs in parallel (one query per repo)
+            repo_details = executor.map(
+                lambda repo: self._fetch_repo_details(username, repo["name"]),
+                repositories
+            )
 
-            # Show detected tech if any
-            if detected_tech and progress_callback:
-                tech_list = ', '.join(detected_tech[:3])
-                if len(detected_tech) > 3:
-                    tech_list += f' +{len(detected_tech)-3} more'
-                tech_msg = f"  └─ {repo['name']}: {tech_list}"
+            for idx, (repo, repo_data) in enumerate(zip(repositories, repo_details), 1):
+                msg = f"🔍 Investigating {repo['name']}... ({idx}/{len(repositories)})"
+                print(f"  {msg}")
                 if progress_callback:
-                    progress_callback("detective", tech_msg)
-
-            # Add enriched data
-            enriched = {
-                **repo,
-                "readme_content": repo_data["readme"],
-                "detected_tech_stack": detected_tech,
-                # Keep first 50 files for reference
-                "file_structure": repo_data["files"][:50]
-            }
+                    progress_callback("detective", msg)
+
+                # Detect tech stack from file patterns
+                detected_tech = self._detect_tech_stack(repo_data["files"])
+
+                # Show detected tech if any
+                if detected_tech and progress_callback:
+                    tech_list = ', '.join(detected_tech[:3])
+                    if len(detected_tech) > 3:
+                        tech_list += f' +{len(detected_tech)-3} more'
+                    tech_msg = f"  └─ {repo['name']}: {tech_list}"
+                    if progress_callback:
+                        progress_callback("detective", tech_msg)
+
+                # Add enriched data
+                enriched = {
+                    **repo,
+                    "readme_content": repo_data["readme"],
+                    "detected_tech_stack": detected_tech,
+                    # Keep first 50 files for reference
+                    "file_structure": repo_data["files"][:50]
+                }
 
-            enriched_repos.append(enriched)
+                enriched_repos.append(enriched)
 
         return enriched_repos
 
@@ -587,7 +730,7 @@ class LanguageAnalyzer:
     """Analyze programming languages and tech stack across repositories"""
 
     @staticmethod
-    def analyze(repositories: List[Dict]) -> Dict[str, Any]:
+    def analyze(repositories: List[Dict]) -> LanguageAnalysis:
         """
         Analyze language distribution, tech stack, and expertise
         No API calls - works with already fetched data
@@ -605,15 +748,17 @@ class LanguageAnalyzer:
 
                 all_topics.extend(repo.get("topics", []))
 
-        # Calculate percentages
+        # Calculate percentages (rank once, scale factor computed once)
+        ranked_languages = language_stats.most_common()
         total_size = sum(language_stats.values())
+        scale = 100 / total_size if total_size > 0 else 0
         language_percentages = {
             lang: {
                 "size": size,
-                "percentage": round((size / total_size * 100), 2) if total_size > 0 else 0,
+                "percentage": round(size * scale, 2),
                 "color": language_colors.get(lang)
             }
-            for lang, size in language_stats.most_common()
+            for lang, size in ranked_languages
         }
 
         # Analyze topics for tech stack
@@ -621,7 +766,7 @@ class LanguageAnalyzer:
 
         return {
             "languages": language_percentages,
-            "top_languages": list(language_stats.most_common(10)),
+            "top_languages": ranked_languages[:10],
             "tech_stack": topic_frequency.most_common(20),
             "total_languages": len(language_stats)
         }
@@ -631,7 +776,7 @@ class ContributionCalendar:
     """Analyze contribution patterns, streaks, and activity"""
 
     @staticmethod
-    def analyze(contribution_data: Dict) -> Dict[str, Any]:
+    def analyze(contribution_data: Dict) -> ContributionAnalysis:
         """
         Analyze contribution patterns from already fetched data
         No additional API calls needed
@@ -689,7 +834,7 @@ class SkillExtractor:
     """Extract skills and technologies from repositories"""
 
     @staticmethod
-    def extract(repositories: List[Dict]) -> Dict[str, Any]:
+    def extract(repositories: List[Dict]) -> SkillSummary:
         """
         Extract skills from repo topics, descriptions, and languages
         No API calls - works with cached data
@@ -736,7 +881,7 @@ class SocialProofCollector:
     """Aggregate social proof metrics across all repositories"""
 
     @staticmethod
-    def collect(repositories: List[Dict], profile: Dict) -> Dict[str, Any]:
+    def collect(repositories: List[Dict], profile: Dict) -> SocialProof:
         """
         Calculate total stars, forks, and other social proof metrics
         No API calls - aggregates existing data
@@ -774,14 +919,18 @@ class SocialProofCollector:
 class GitHubProfileAnalyzer:
     """Main class that orchestrates all tools"""
 
-    def __init__(self, github_token: str):
-        self.client = GitHubAPIClient(github_token)
+    def __init__(self, github_token: str, session=None):
+        self.client = GitHubAPIClient(github_token, session=session)
         self.profile_detective = ProfileDetective(self.client)
         self.repo_stalker = RepositoryStalker(self.client)
         self.ex_readme = ExReadme(self.client)
         self.tech_detective = TechStackDetective(self.client)
 
-    def analyze_user(self, username: str) -> Dict[str, Any]:
+    def close(self):
+        """Release the underlying HTTP connection pool"""
+        self.client.close()
+
+    def analyze_user(self, username: str) -> ProfileAnalysis:
         """
         Complete user analysis with ALL tools
         Only 2 API calls total:
@@ -833,8 +982,26 @@ class GitHubProfileAnalyzer:
         print("⭐ Collecting social proof...")
         social_proof = SocialProofCollector.collect(enriched_repos, profile)
 
+        # Aggregate repo-level stats in one pass so consumers don't re-scan
+        pinned_count = 0
+        readme_count = 0
+        all_tech = set()
+        for repo in enriched_repos:
+            if repo.get("is_pinned"):
+                pinned_count += 1
+            if repo.get("readme_content"):
+                readme_count += 1
+            all_tech.update(repo.get("detected_tech_stack", []))
+
+        profile["stats"].update({
+            "pinned_count": pinned_count,
+            "readme_count": readme_count,
+            "all_tech": sorted(all_tech),
+            "tech_count": len(all_tech),
+        })
+
         # Compile everything
-        complete_analysis = {
+        complete_analysis: ProfileAnalysis = {
             "profile": profile["basic_info"],
             "stats": profile["stats"],
             "contributions": contribution_analysis,
@@ -851,8 +1018,43 @@ class GitHubProfileAnalyzer:
         return complete_analysis
 
 
-def main():
-    """Comprehensive test of all GitHub Profile Analyzer tools"""
+# Flattens line breaks/tabs to spaces in one pass for single-line previews
+_WS_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+_README_NOT_FOUND = "Status:    Not found (No {u}/{u} repository or README.md)"
+
+
+def _truncate(text: Optional[str], limit: int, prefix: str = "") -> str:
+    """Prefix text, cut to `limit` chars with "..." if longer, or N/A if empty"""
+    if not text:
+        return f"{prefix}N/A"
+    if len(text) > limit:
+        return f"{prefix}{text[:limit]}..."
+    return f"{prefix}{text}"
+
+
+def _write_ndjson(result: ProfileAnalysis, out) -> None:
+    """
+    Write the analysis as NDJSON: one {"section": ..., "data": ...} record per
+    top-level section, with each repository streamed as its own record
+    """
+    for section, data in result.items():
+        if section == "repositories":
+            # Read through the typed key - items() only yields object values
+            for repo in result["repositories"]:
+                out.write(json.dumps(
+                    {"section": "repository", "data": repo}, default=str) + "\n")
+        else:
+            out.write(json.dumps(
+                {"section": section, "data": data}, default=str) + "\n")
+
+
+def analyze_and_report(username: Optional[str] = None, json_out=None):
+    """
+    Comprehensive test of all GitHub Profile Analyzer tools
+    If json_out is given, the analysis is written there as NDJSON instead of
+    the printed report
+    """
     print("=" * 70)
     print("🚀 GRWM - GitHub README With Me")
     print("   Testing All Tools & Components")
@@ -868,7 +1070,8 @@ def main():
         return
 
     # Test with a username
-    username = input("\n👤 Enter GitHub username to analyze: ").strip()
+    if not username:
+        username = input("\n👤 Enter GitHub username to analyze: ").strip()
     if not username:
         print("❌ Username cannot be empty")
         return
@@ -884,6 +1087,21 @@ def main():
         # Run the full analysis
         result = analyzer.analyze_user(username)
 
+        # Pull out the sections once instead of re-indexing `result` per line
+        profile = result['profile']
+        stats = result['stats']
+        repos = result['repositories']
+        n_repos = len(repos)
+        contrib = result['contributions']
+        langs = result['languages']
+        skills = result['skills']
+        social = result['social_proof']
+        existing_readme = result['existing_readme']
+
+        if json_out is not None:
+            _write_ndjson(result, json_out)
+            return result
+
         # ============================================================
         # Display Comprehensive Results
         # ============================================================
@@ -898,11 +1116,9 @@ def main():
         print("\n" + "─" * 70)
         print("🔍 1. PROFILE DETECTIVE - Basic Profile Information")
         print("─" * 70)
-        profile = result['profile']
         print(f"Name:            {profile['name']}")
         print(f"Username:        @{username}")
-        print(f"Bio:             {profile['bio'][:100]}..." if profile['bio'] and len(
-            profile['bio']) > 100 else f"Bio:             {profile['bio']}")
+        print(_truncate(profile['bio'], 100, "Bio:             "))
         print(f"Company:         {profile['company'] or 'N/A'}")
         print(f"Location:        {profile['location'] or 'N/A'}")
         print(f"Email:           {profile['email'] or 'N/A'}")
@@ -928,24 +1144,22 @@ def main():
         # ============================================================
         print("\n" + "─" * 70)
         print(
-            f"📦 2. REPOSITORY STALKER - Selected {len(result['repositories'])} Repositories")
+            f"📦 2. REPOSITORY STALKER - Selected {n_repos} Repositories")
         print("─" * 70)
-        print(f"Total Repositories:     {result['stats']['total_repos']}")
+        print(f"Total Repositories:     {stats['total_repos']}")
         print(
-            f"Analyzed Repositories:  {len(result['repositories'])} (Guaranteed Unique)")
+            f"Analyzed Repositories:  {n_repos} (Guaranteed Unique)")
         print(
-            f"Pinned Repositories:    {sum(1 for r in result['repositories'] if r.get('is_pinned'))}")
+            f"Pinned Repositories:    {stats['pinned_count']}")
         print(f"\nTop Repositories:")
-        for i, repo in enumerate(result['repositories'][:5], 1):
+        for i, repo in enumerate(repos[:5], 1):
             pinned = "📌 " if repo.get('is_pinned') else "   "
             print(
                 f"  {pinned}{i}. {repo['name']} - ⭐ {repo['stars']} | 🍴 {repo['forks']}")
-            print(f"      {repo['description'][:70]}..." if repo['description'] and len(
-                repo['description']) > 70 else f"      {repo['description']}")
+            print(_truncate(repo['description'], 70, "      "))
 
-        if len(result['repositories']) > 5:
-            print(
-                f"  ... and {len(result['repositories']) - 5} more repositories")
+        if n_repos > 5:
+            print(f"  ... and {n_repos - 5} more repositories")
 
         # ============================================================
         # 3. EXREADME RESULTS
@@ -953,14 +1167,13 @@ def main():
         print("\n" + "─" * 70)
         print("📄 3. EXREADME - Existing Profile README")
         print("─" * 70)
-        if result['existing_readme']:
-            readme_preview = result['existing_readme'][:200].replace('\n', ' ')
+        if existing_readme:
+            readme_preview = _truncate(existing_readme, 200, "Preview:   ")
             print(f"Status:    Found ✓")
-            print(f"Length:    {len(result['existing_readme'])} characters")
-            print(f"Preview:   {readme_preview}...")
+            print(f"Length:    {len(existing_readme)} characters")
+            print(readme_preview.translate(_WS_TABLE))
         else:
-            print(
-                "Status:    Not found (No {username}/{username} repository or README.md)")
+            print(_README_NOT_FOUND.format(u=username))
 
         # ============================================================
         # 4. TECHSTACK DETECTIVE RESULTS
@@ -968,39 +1181,26 @@ def main():
         print("\n" + "─" * 70)
         print("🔧 4. TECHSTACK DETECTIVE - Detected Technologies")
         print("─" * 70)
-        all_tech = set()
-        repo_tech_count = {}
-        repos_with_readme = 0
-
-        for repo in result['repositories']:
-            tech_stack = repo.get('detected_tech_stack', [])
-            all_tech.update(tech_stack)
-            if tech_stack:
-                repo_tech_count[repo['name']] = len(tech_stack)
-            if repo.get('readme_content'):
-                repos_with_readme += 1
-
-        print(f"Total Technologies Detected:    {len(all_tech)}")
+        n_tech = stats['tech_count']
+        print(f"Total Technologies Detected:    {n_tech}")
         print(
-            f"Repositories with READMEs:      {repos_with_readme} / {len(result['repositories'])}")
+            f"Repositories with READMEs:      {stats['readme_count']} / {n_repos}")
         print(f"\n🏆 All Detected Technologies:")
-        if all_tech:
-            # Group technologies for better display
-            tech_list = sorted(list(all_tech))
-            for i in range(0, len(tech_list), 5):
-                print(f"  {', '.join(tech_list[i:i+5])}")
+        if stats['all_tech']:
+            # Group technologies for better display (already sorted)
+            for tech_group in batched(stats['all_tech'], 5):
+                print(f"  {', '.join(tech_group)}")
         else:
             print("  None detected")
 
         print(f"\n📊 Top 5 Repos by Tech Stack Diversity:")
-        sorted_repos = sorted(repo_tech_count.items(),
-                              key=lambda x: x[1], reverse=True)[:5]
-        for repo_name, tech_count in sorted_repos:
-            repo_data = next(
-                r for r in result['repositories'] if r['name'] == repo_name)
-            print(f"  • {repo_name}: {tech_count} technologies")
-            print(
-                f"    → {', '.join(repo_data.get('detected_tech_stack', [])[:8])}")
+        diverse_repos = sorted(
+            (r for r in repos if r.get('detected_tech_stack')),
+            key=lambda r: len(r['detected_tech_stack']), reverse=True)[:5]
+        for repo in diverse_repos:
+            tech_stack = repo['detected_tech_stack']
+            print(f"  • {repo['name']}: {len(tech_stack)} technologies")
+            print(f"    → {', '.join(tech_stack[:8])}")
 
         # ============================================================
         # 5. LANGUAGE ANALYZER RESULTS
@@ -1009,15 +1209,15 @@ def main():
         print("💻 5. LANGUAGE ANALYZER - Programming Languages")
         print("─" * 70)
         print(
-            f"Total Languages:        {result['languages']['total_languages']}")
+            f"Total Languages:        {langs['total_languages']}")
         print(f"\nTop Languages by Usage:")
-        for i, (lang, count) in enumerate(result['languages']['top_languages'][:8], 1):
-            lang_info = result['languages']['languages'].get(lang, {})
+        for i, (lang, count) in enumerate(langs['top_languages'][:8], 1):
+            lang_info = langs['languages'].get(lang, {})
             percentage = lang_info.get('percentage', 0)
             print(f"  {i}. {lang:20} - {count:>10,} bytes ({percentage:>5.1f}%)")
 
         print(f"\nTech Stack from Topics:")
-        for i, (topic, count) in enumerate(result['languages']['tech_stack'][:10], 1):
+        for i, (topic, count) in enumerate(langs['tech_stack'][:10], 1):
             print(f"  {i}. {topic:20} - used in {count} repositories")
 
         # ============================================================
@@ -1026,7 +1226,6 @@ def main():
         print("\n" + "─" * 70)
         print("📈 6. CONTRIBUTION CALENDAR - Activity Analysis")
         print("─" * 70)
-        contrib = result['contributions']
         print(
             f"Total Contributions:        {contrib['total_contributions']:,}")
         print(
@@ -1046,7 +1245,6 @@ def main():
         print("\n" + "─" * 70)
         print("🎯 7. SKILL EXTRACTOR - Skills & Technologies")
         print("─" * 70)
-        skills = result['skills']
         print(f"Total Unique Skills:    {skills['total_unique_skills']}")
         print(f"\nFrameworks ({len(skills['frameworks'])}):")
         print(
@@ -1064,7 +1262,6 @@ def main():
         print("\n" + "─" * 70)
         print("⭐ 8. SOCIAL PROOF COLLECTOR - GitHub Metrics")
         print("─" * 70)
-        social = result['social_proof']
         print(f"Total Stars:                {social['total_stars']:,} ⭐")
         print(f"Total Forks:                {social['total_forks']:,} 🍴")
         print(f"Total Followers:            {social['total_followers']:,} 👥")
@@ -1089,13 +1286,13 @@ def main():
         print(f"\n📊 Summary:")
         print(f"  ✓ ProfileDetective      - Fetched complete profile")
         print(
-            f"  ✓ RepositoryStalker     - Analyzed {len(result['repositories'])} unique repositories")
+            f"  ✓ RepositoryStalker     - Analyzed {n_repos} unique repositories")
         print(
-            f"  ✓ ExReadme              - {'Found' if result['existing_readme'] else 'Not found'}")
+            f"  ✓ ExReadme              - {'Found' if existing_readme else 'Not found'}")
         print(
-            f"  ✓ TechStackDetective    - Detected {len(all_tech)} technologies")
+            f"  ✓ TechStackDetective    - Detected {n_tech} technologies")
         print(
-            f"  ✓ LanguageAnalyzer      - Analyzed {result['languages']['total_languages']} languages")
+            f"  ✓ LanguageAnalyzer      - Analyzed {langs['total_languages']} languages")
         print(
             f"  ✓ ContributionCalendar  - Processed {contrib['total_contributions']:,} contributions")
         print(
@@ -1114,6 +1311,29 @@ def main():
         traceback.print_exc()
         return None
 
+    finally:
+        analyzer.close()
+
+
+def main():
+    """CLI entry point: python main.py [username] [--json]"""
+    parser = argparse.ArgumentParser(
+        description="GRWM - analyze a GitHub profile with all tools")
+    parser.add_argument(
+        "username", nargs="?", help="GitHub username (prompted for if omitted)")
+    parser.add_argument(
+        "--json", action="store_true",
+        help="write the analysis to stdout as NDJSON instead of the report")
+    args = parser.parse_args()
+
+    if not args.json:
+        return analyze_and_report(args.username)
+
+    # stdout carries only the NDJSON records, everything else goes to stderr
+    out = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        return analyze_and_report(args.username, json_out=out)
+
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,7 @@ Run this to test each agent independently as they're built
 from agents import (
     create_detective_graph,
     create_initial_state,
+    AgentState,
     DetectiveAgent,
     CTOAgent,
     GhostwriterAgent,
@@ -13,52 +14,164 @@ from agents import (
     GOOGLE_API_KEY,
 )
 import os
+import sys
+import argparse
+import traceback
 import json
 import asyncio
-from datetime import datetime
+import hashlib
+from datetime import datetime, timezone
+from itertools import batched
+from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
+# orjson is optional - much faster for big result dicts, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment
 load_dotenv()
 
 # Import our agents
 
+# Banner rules for section / subsection headers
+_EQ = "=" * 70
+_DASH = "─" * 70
+
+# Detective / CTO results are cached here between runs (GRWM_NO_CACHE=1 to bypass)
+CACHE_DIR = ".cache"
+
+# One event loop shared by every async test run, created on first use
+_loop = None
+
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop"""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+def close_loop():
+    """Close the shared event loop if one was created"""
+    global _loop
+    if _loop is not None:
+        _loop.close()
+        _loop = None
+
+
+# One DetectiveAgent (and GitHub session) reused by every Detective test run,
+# created on first use so the menu doesn't load the LLM client up front
+_detective = None
+
+
+def close_detective():
+    """Close the shared DetectiveAgent if one was created"""
+    global _detective
+    if _detective is not None:
+        _detective.close()
+        _detective = None
+
+
+def _json_bytes(data, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON bytes (non-JSON values fall back to str)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(data, indent=2 if indent else None, default=str,
+                      ensure_ascii=False).encode("utf-8")
+
+
+def _detective_cache_path(username: str) -> str:
+    """Cache file for a user's Detective data, one per UTC day"""
+    day = datetime.now(timezone.utc).strftime("%Y%m%d")
+    return os.path.join(CACHE_DIR, f"detective_{username.lower()}_{day}.json")
+
+
+def _cto_cache_path(raw_data: dict) -> str:
+    """Cache file for a CTO analysis, keyed by a hash of its Detective data"""
+    digest = hashlib.sha256(json.dumps(
+        raw_data, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"cto_{digest}.json")
+
+
+def _load_cache(path: str):
+    """Load a cached result, or None if missing, unreadable or disabled"""
+    if os.getenv("GRWM_NO_CACHE") or not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(path: str, data: dict):
+    """Write a result to the cache (best effort)"""
+    if os.getenv("GRWM_NO_CACHE"):
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        Path(path).write_bytes(_json_bytes(data, indent=False))
+    except OSError as e:
+        print(f"⚠️  Could not write cache: {e}")
+
 
 def print_section(title: str):
     """Pretty print section headers"""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+    write_lines(["\n" + _EQ, f"  {title}", _EQ])
 
 
 def print_subsection(title: str):
     """Pretty print subsection headers"""
-    print("\n" + "─" * 70)
-    print(f"  {title}")
-    print("─" * 70)
+    write_lines(["\n" + _DASH, f"  {title}", _DASH])
+
+
+def write_lines(lines: list):
+    """Write a block of lines to stdout in one call instead of print per line"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+TONES = ("professional", "genz", "minimalist", "creative")
+
+
+def select_tone() -> str:
+    """Ask for the README tone (defaults to professional)"""
+    print("\n🎨 README Tone Options:")
+    print("1. Professional (polished, business-ready)")
+    print("2. GenZ (casual, relatable vibes)")
+    print("3. Minimalist (clean, data-focused)")
+    print("4. Creative (unique, storytelling)")
+
+    tone_choice = input("Select tone (1-4, default=1): ").strip()
+    tone_map = dict(zip("1234", TONES))
+    return tone_map.get(tone_choice, "professional")
 
 
 def check_environment():
     """Check if all required environment variables are set"""
     print_section("🔧 Environment Check")
 
-    issues = []
-
-    if not GITHUB_TOKEN:
-        issues.append("❌ GITHUB_PAT not found")
-        print("❌ GITHUB_PAT: Not Set")
-        print("   → Get one at: https://github.com/settings/tokens")
-    else:
-        print(f"✅ GITHUB_PAT: Set (length: {len(GITHUB_TOKEN)})")
-
-    if not GOOGLE_API_KEY:
-        issues.append("❌ GOOGLE_API_KEY not found")
-        print("❌ GOOGLE_API_KEY: Not Set")
-        print("   → Get one at: https://makersuite.google.com/app/apikey")
-    else:
-        print(f"✅ GOOGLE_API_KEY: Set (length: {len(GOOGLE_API_KEY)})")
+    ok = True
+    for value, name, url in (
+        (GITHUB_TOKEN, "GITHUB_PAT", "https://github.com/settings/tokens"),
+        (GOOGLE_API_KEY, "GOOGLE_API_KEY",
+         "https://makersuite.google.com/app/apikey"),
+    ):
+        if value:
+            print(f"✅ {name}: Set (length: {len(value)})")
+        else:
+            print(f"❌ {name}: Not Set\n   → Get one at: {url}")
+            ok = False
 
-    if issues:
+    if not ok:
         print("\n⚠️  Please fix the above issues before continuing")
         print("   1. Copy .env.example to .env")
         print("   2. Add your API keys")
@@ -68,172 +181,197 @@ def check_environment():
     return True
 
 
-def test_detective_standalone():
-    """Test Detective agent without the graph"""
+def test_detective_standalone(username: Optional[str] = None):
+    """
+    Test Detective agent without the graph
+    Reuses one DetectiveAgent (and its HTTP session) across runs
+    """
+    global _detective
     print_section("🔍 Testing Detective Agent (Standalone)")
 
-    username = input("\n👤 Enter GitHub username to test: ").strip()
+    if username is None:
+        username = input("\n👤 Enter GitHub username to test: ").strip()
     if not username:
         print("❌ Username required")
         return None
 
     try:
-        print(f"\n🚀 Initializing Detective...")
-        detective = DetectiveAgent(GITHUB_TOKEN)
+        cache_path = _detective_cache_path(username)
+        raw_data = _load_cache(cache_path)
+        if raw_data:
+            print(f"\n📂 Using cached Detective data: {cache_path}")
+        else:
+            print()
+            if _detective is None:
+                print(f"🚀 Initializing Detective...")
+                _detective = DetectiveAgent(GITHUB_TOKEN)
 
-        print(f"🔍 Starting investigation...")
-        raw_data = asyncio.run(detective.investigate_parallel(username))
+            print(f"🔍 Starting investigation...")
+            raw_data = run_async(_detective.investigate_parallel(username))
+            _save_cache(cache_path, raw_data)
 
         print_subsection("📊 Results Summary")
-        print(f"Profile Name:       {raw_data['profile']['name']}")
-        print(f"Username:           @{username}")
-        print(f"Bio:                {raw_data['profile']['bio'][:80]}..." if raw_data['profile']['bio'] and len(
+        buf = []
+        buf.append(f"Profile Name:       {raw_data['profile']['name']}")
+        buf.append(f"Username:           @{username}")
+        buf.append(f"Bio:                {raw_data['profile']['bio'][:80]}..." if raw_data['profile']['bio'] and len(
             raw_data['profile']['bio']) > 80 else f"Bio:                {raw_data['profile']['bio']}")
-        print(
+        buf.append(
             f"Location:           {raw_data['profile']['location'] or 'N/A'}")
-        print(f"Followers:          {raw_data['stats']['followers']:,}")
-        print(f"Total Repos:        {raw_data['stats']['total_repos']:,}")
-        print(
+        buf.append(f"Followers:          {raw_data['stats']['followers']:,}")
+        buf.append(f"Total Repos:        {raw_data['stats']['total_repos']:,}")
+        buf.append(
             f"Total Stars:        {raw_data['social_proof']['total_stars']:,}")
-        print(
+        buf.append(
             f"Total Forks:        {raw_data['social_proof']['total_forks']:,}")
-        print(
+        buf.append(
             f"Repositories:       {len(raw_data['repositories'])} (analyzed)")
-        print(
+        buf.append(
             f"Has Profile README: {'Yes ✓' if raw_data['existing_readme'] else 'No'}")
+        write_lines(buf)
 
         print_subsection("📦 Top 5 Repositories")
+        buf = []
         for i, repo in enumerate(raw_data['repositories'][:5], 1):
             pinned = "📌" if repo.get('is_pinned') else "  "
-            print(f"{pinned} {i}. {repo['name']}")
-            print(
+            buf.append(f"{pinned} {i}. {repo['name']}")
+            buf.append(
                 f"      ⭐ {repo['stars']} | 🍴 {repo['forks']} | {repo['primary_language'] or 'N/A'}")
-            print(
+            buf.append(
                 f"      Tech: {', '.join(repo.get('detected_tech_stack', [])[:5]) or 'None detected'}")
-            print(
+            buf.append(
                 f"      README: {'✓' if repo.get('readme_content') else '✗'}")
+        write_lines(buf)
 
         print_subsection("🔧 Technology Overview")
+        buf = []
         all_tech = set()
         repos_with_readme = 0
         for repo in raw_data['repositories']:
-            all_tech.update(repo.get('detected_tech_stack', []))
+            tech = repo.get('detected_tech_stack')
+            if tech:
+                all_tech.update(tech)
             if repo.get('readme_content'):
                 repos_with_readme += 1
 
-        print(f"Detected Technologies: {len(all_tech)}")
-        if all_tech:
-            tech_list = sorted(list(all_tech))
-            for i in range(0, len(tech_list), 6):
-                print(f"  {', '.join(tech_list[i:i+6])}")
+        buf.append(f"Detected Technologies: {len(all_tech)}")
+        for chunk in batched(sorted(all_tech), 6):
+            buf.append(f"  {', '.join(chunk)}")
 
-        print(
+        buf.append(
             f"\nREADME Coverage: {repos_with_readme}/{len(raw_data['repositories'])} repositories")
+        write_lines(buf)
 
         print("\n✅ Detective standalone test passed!")
         return raw_data
 
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
-def test_cto_standalone(raw_data: dict = None):
+def test_cto_standalone(raw_data: dict):
     """Test CTO agent without the graph (requires Detective data)"""
-    print_section("🧠 Testing CTO Agent (Standalone)")
-
-    # Get data from Detective if not provided
+    # The caller runs Detective first - never investigate again from here
     if not raw_data:
-        print("⚠️  No raw data provided. Running Detective first...")
-        raw_data = test_detective_standalone()
-        if not raw_data:
-            print("❌ Cannot test CTO without Detective data")
-            return None
+        raise ValueError("test_cto_standalone requires Detective raw_data")
+
+    print_section("🧠 Testing CTO Agent (Standalone)")
 
     try:
-        print(f"\n🚀 Initializing CTO...")
-        cto = CTOAgent()
+        cache_path = _cto_cache_path(raw_data)
+        analysis = _load_cache(cache_path)
+        if analysis:
+            print(f"\n📂 Using cached CTO analysis: {cache_path}")
+        else:
+            print(f"\n🚀 Initializing CTO...")
+            cto = CTOAgent()
 
-        print(f"🧠 Starting analysis...")
-        analysis = cto.analyze(raw_data)
+            print(f"🧠 Starting analysis...")
+            analysis = cto.analyze(raw_data)
+            _save_cache(cache_path, analysis)
 
         print_subsection("📊 Analysis Summary")
-
+        buf = []
         # Developer Archetype
-        print(f"Developer Archetype:")
-        print(f"  Primary:    {analysis['developer_archetype']['primary']}")
-        print(f"  Secondary:  {analysis['developer_archetype']['secondary']}")
-        print(f"  Full Title: {analysis['developer_archetype']['full_title']}")
+        buf.append(f"Developer Archetype:")
+        buf.append(f"  Primary:    {analysis['developer_archetype']['primary']}")
+        buf.append(f"  Secondary:  {analysis['developer_archetype']['secondary']}")
+        buf.append(f"  Full Title: {analysis['developer_archetype']['full_title']}")
 
         # Personality Comment
-        print(f"\n💬 CTO's Verdict:")
-        print(f"  \"{analysis['skill_domains']['personality_comment']}\"")
+        buf.append(f"\n💬 CTO's Verdict:")
+        buf.append(f"  \"{analysis['skill_domains']['personality_comment']}\"")
 
         # Grind Score
-        print(f"\nGrind Score:")
-        print(
+        buf.append(f"\nGrind Score:")
+        buf.append(
             f"  Score:  {analysis['grind_score']['score']} {analysis['grind_score']['emoji']}")
-        print(f"  Label:  {analysis['grind_score']['label']}")
-        print(f"  Breakdown:")
-        for key, value in analysis['grind_score']['breakdown'].items():
-            print(f"    - {key}: {value}")
+        buf.append(f"  Label:  {analysis['grind_score']['label']}")
+        buf.append("  Breakdown:")
+        buf.extend(
+            f"    - {key}: {value}"
+            for key, value in analysis['grind_score']['breakdown'].items())
 
         # Language Dominance
-        print(f"\nLanguage Dominance:")
+        buf.append(f"\nLanguage Dominance:")
         primary_lang = analysis['language_dominance']['primary_language']
-        print(
+        buf.append(
             f"  Primary: {primary_lang['name']} ({primary_lang['percentage']}%)")
-        print(
+        buf.append(
             f"  Specialist: {'Yes ✓' if analysis['language_dominance']['is_specialist'] else 'No'}")
-        print(f"  Top 5 Languages:")
-        for lang in analysis['language_dominance']['top_5_languages']:
-            print(f"    - {lang['name']}: {lang['percentage']}%")
+        buf.append("  Top 5 Languages:")
+        buf.extend(
+            f"    - {lang['name']}: {lang['percentage']}%"
+            for lang in analysis['language_dominance']['top_5_languages'])
 
         # Skill Domains
-        print(f"\nSkill Domains:")
-        print(f"  Domain Count: {analysis['skill_domains']['domain_count']}")
-        print(
+        buf.append(f"\nSkill Domains:")
+        buf.append(f"  Domain Count: {analysis['skill_domains']['domain_count']}")
+        buf.append(
             f"  Full Stack: {'Yes ✓' if analysis['skill_domains']['is_full_stack'] else 'No'}")
-        print(f"  Primary Domains:")
-        for domain in analysis['skill_domains']['primary_domains']:
-            print(f"    - {domain['name']} (score: {domain['score']})")
-            print(
-                f"      Technologies: {', '.join(domain['technologies'][:5])}")
+        buf.append("  Primary Domains:")
+        buf.extend(
+            f"    - {domain['name']} (score: {domain['score']})\n"
+            f"      Technologies: {', '.join(domain['technologies'][:5])}"
+            for domain in analysis['skill_domains']['primary_domains'])
 
         # Tech Diversity
-        print(f"\nTech Diversity:")
-        print(
+        buf.append(f"\nTech Diversity:")
+        buf.append(
             f"  Classification: {analysis['tech_diversity']['classification']}")
-        print(f"  Description: {analysis['tech_diversity']['description']}")
-        print(
+        buf.append(f"  Description: {analysis['tech_diversity']['description']}")
+        buf.append(
             f"  Total Technologies: {analysis['tech_diversity']['total_technologies']}")
-        print(
+        buf.append(
             f"  Diversity Score: {analysis['tech_diversity']['diversity_score']}")
-        print(f"  Category Breakdown:")
-        for category, count in analysis['tech_diversity']['category_breakdown'].items():
-            print(f"    - {category}: {count}")
+        buf.append("  Category Breakdown:")
+        buf.extend(
+            f"    - {category}: {count}"
+            for category, count in analysis['tech_diversity']['category_breakdown'].items())
 
         # Key Projects
-        print(f"\nKey Projects:")
+        buf.append(f"\nKey Projects:")
         for i, project in enumerate(analysis['key_projects'], 1):
-            print(
+            buf.append(
                 f"  {i}. {project['name']} (Complexity: {project['complexity_score']})")
-            print(
+            buf.append(
                 f"     ⭐ {project['stars']} | 🍴 {project['forks']} | {project['primary_language'] or 'N/A'}")
-            print(f"     Tech: {', '.join(project['tech_stack'][:5])}")
+            buf.append(f"     Tech: {', '.join(project['tech_stack'][:5])}")
 
         # Impact Metrics
-        print(f"\nImpact Metrics:")
-        print(f"  Impact Score: {analysis['impact_metrics']['impact_score']}")
-        print(f"  Total Stars: {analysis['impact_metrics']['total_stars']:,}")
-        print(f"  Total Forks: {analysis['impact_metrics']['total_forks']:,}")
-        print(
+        buf.append(f"\nImpact Metrics:")
+        buf.append(f"  Impact Score: {analysis['impact_metrics']['impact_score']}")
+        buf.append(f"  Total Stars: {analysis['impact_metrics']['total_stars']:,}")
+        buf.append(f"  Total Forks: {analysis['impact_metrics']['total_forks']:,}")
+        buf.append(
             f"  Engagement Rate: {analysis['impact_metrics']['engagement_rate']}%")
-        print(
+        buf.append(
             f"  Contribution Intensity: {analysis['impact_metrics']['contribution_intensity']}/day")
 
+        write_lines(buf)
+
         # Summary
         print_subsection("📝 Summary")
         print(analysis['summary'])
@@ -243,16 +381,16 @@ def test_cto_standalone(raw_data: dict = None):
 
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
-def test_detective_with_graph():
+async def test_detective_with_graph(username: Optional[str] = None):
     """Test Detective agent within the LangGraph"""
     print_section("🤖 Testing Detective Agent (LangGraph Integration)")
 
-    username = input("\n👤 Enter GitHub username to test: ").strip()
+    if username is None:
+        username = input("\n👤 Enter GitHub username to test: ").strip()
     if not username:
         print("❌ Username required")
         return None
@@ -265,7 +403,7 @@ def test_detective_with_graph():
         initial_state = create_initial_state(username)
 
         print(f"🤖 Running graph with streaming...")
-        print("─" * 70)
+        print(_DASH)
 
         # Config with thread_id (required for checkpointer)
         config = {
@@ -274,7 +412,7 @@ def test_detective_with_graph():
         }
 
         final_state = None
-        for event in app.stream(initial_state, config):
+        async for event in app.astream(initial_state, config):
             # Print event type
             event_name = list(event.keys())[0]
             print(f"\n📡 Event: {event_name}")
@@ -318,7 +456,7 @@ def test_detective_with_graph():
                     final_state = state
                     final_state = state
 
-        print("\n" + "─" * 70)
+        print("\n" + _DASH)
 
         if final_state and final_state.get("raw_data"):
             print_subsection("📊 Final State Summary")
@@ -342,26 +480,29 @@ def test_detective_with_graph():
 
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
-def save_test_results(data: dict, username: str):
+def save_test_results(data: dict, username: str, timestamp: Optional[str] = None):
     """Save test results to JSON file"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"test_results_{username}_{timestamp}.json"
 
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        Path(filename).write_bytes(_json_bytes(data))
         print(f"✅ Saved to: {filename}")
     except Exception as e:
         print(f"❌ Failed to save: {e}")
 
 
-def test_ghostwriter_standalone(raw_data: dict, analysis: dict):
-    """Test Ghostwriter agent without the graph"""
+def test_ghostwriter_standalone(raw_data: dict, analysis: dict,
+                                tone: Optional[str] = None,
+                                interactive: bool = True):
+    """
+    Test Ghostwriter agent without the graph
+    Pass a tone and interactive=False to run without any prompts
+    """
     print_section("✍️  Testing Ghostwriter Agent (Standalone)")
 
     if not raw_data or not analysis:
@@ -373,20 +514,11 @@ def test_ghostwriter_standalone(raw_data: dict, analysis: dict):
         ghostwriter = GhostwriterAgent()
 
         # Get tone preference
-        print("\n🎨 README Tone Options:")
-        print("1. Professional (polished, business-ready)")
-        print("2. GenZ (casual, relatable vibes)")
-        print("3. Minimalist (clean, data-focused)")
-        print("4. Creative (unique, storytelling)")
-
-        tone_choice = input("Select tone (1-4, default=1): ").strip()
-        tone_map = {"1": "professional", "2": "genz",
-                    "3": "minimalist", "4": "creative"}
-        tone = tone_map.get(tone_choice, "professional")
+        if tone is None:
+            tone = select_tone()
 
         # Create mock state
-        from agents import AgentState
-        state = {
+        state: AgentState = {
             "username": raw_data['profile']['login'],
             "user_preferences": {"tone": tone, "style": "modern"},
             "raw_data": raw_data,
@@ -405,39 +537,41 @@ def test_ghostwriter_standalone(raw_data: dict, analysis: dict):
 
         if result.get("final_markdown"):
             markdown = result["final_markdown"]
+            preview = markdown[:500]
+            truncated = len(markdown) > 500
 
             print_subsection("📊 Results Summary")
             print(f"Markdown Length:    {len(markdown):,} characters")
-            print(f"Lines:              {len(markdown.split(chr(10))):,}")
+            print(f"Lines:              {markdown.count(chr(10)) + 1:,}")
             print(
                 f"Version:            {len(result.get('generation_history', []))}")
             print(f"Tone:               {tone.title()}")
 
             # Preview first 500 chars
-            print("\n" + "─" * 70)
+            print("\n" + _DASH)
             print("📝 Preview (first 500 chars):")
-            print("─" * 70)
-            print(markdown[:500])
-            if len(markdown) > 500:
+            print(_DASH)
+            print(preview)
+            if truncated:
                 print("...")
 
-            # Ask to see full
-            show_full = input(
-                "\n📄 Show full README? (y/n): ").strip().lower()
-            if show_full == 'y':
-                print("\n" + "=" * 70)
-                print("📝 FULL README.md")
-                print("=" * 70 + "\n")
-                print(markdown)
-                print("\n" + "=" * 70)
-
-            # Ask to save
-            save = input("\n💾 Save to file? (y/n): ").strip().lower()
-            if save == 'y':
-                filename = f"README_{state['username']}.md"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(markdown)
-                print(f"✅ Saved to {filename}")
+            if interactive:
+                # Ask to see full
+                show_full = input(
+                    "\n📄 Show full README? (y/n): ").strip().lower()
+                if show_full == 'y':
+                    print("\n" + _EQ)
+                    print("📝 FULL README.md")
+                    print(_EQ + "\n")
+                    print(markdown)
+                    print("\n" + _EQ)
+
+                # Ask to save
+                save = input("\n💾 Save to file? (y/n): ").strip().lower()
+                if save == 'y':
+                    filename = f"README_{state['username']}.md"
+                    Path(filename).write_bytes(markdown.encode("utf-8"))
+                    print(f"✅ Saved to {filename}")
 
             print("\n✅ Ghostwriter test passed!")
             return result
@@ -448,32 +582,31 @@ def test_ghostwriter_standalone(raw_data: dict, analysis: dict):
 
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
-def test_complete_pipeline():
-    """Test the complete agent pipeline: Detective → CTO → Ghostwriter"""
+async def test_complete_pipeline(raw_data: Optional[dict] = None, analysis: Optional[dict] = None,
+                                 username: Optional[str] = None, tone: Optional[str] = None,
+                                 interactive: bool = True):
+    """
+    Test the complete agent pipeline: Detective → CTO → Ghostwriter
+    Pre-computed raw_data / analysis are seeded into the state so the graph
+    skips those agents instead of re-running them
+    Pass username, tone and interactive=False to run without any prompts
+    """
     print_section(
         "🚀 Testing Complete Pipeline (Detective → CTO → Ghostwriter)")
 
-    username = input("\n👤 Enter GitHub username to test: ").strip()
+    if username is None:
+        username = input("\n👤 Enter GitHub username to test: ").strip()
     if not username:
         print("❌ Username required")
         return None
 
     # Get tone preference
-    print("\n🎨 README Tone Options:")
-    print("1. Professional (polished, business-ready)")
-    print("2. GenZ (casual, relatable vibes)")
-    print("3. Minimalist (clean, data-focused)")
-    print("4. Creative (unique, storytelling)")
-
-    tone_choice = input("Select tone (1-4, default=1): ").strip()
-    tone_map = {"1": "professional", "2": "genz",
-                "3": "minimalist", "4": "creative"}
-    tone = tone_map.get(tone_choice, "professional")
+    if tone is None:
+        tone = select_tone()
 
     try:
         print(f"\n🚀 Creating Complete LangGraph...")
@@ -484,9 +617,13 @@ def test_complete_pipeline():
             username,
             preferences={"tone": tone, "style": "modern"}
         )
+        if raw_data:
+            initial_state["raw_data"] = raw_data
+        if analysis:
+            initial_state["analysis"] = analysis
 
         print(f"🤖 Running complete pipeline with streaming...")
-        print("─" * 70)
+        print(_DASH)
 
         # Config with thread_id (required for checkpointer)
         config = {
@@ -495,7 +632,7 @@ def test_complete_pipeline():
         }
 
         final_state = None
-        for event in app.stream(initial_state, config):
+        async for event in app.astream(initial_state, config):
             # Print event type
             event_name = list(event.keys())[0]
             print(f"\n📡 Event: {event_name}")
@@ -529,12 +666,35 @@ def test_complete_pipeline():
                     markdown = state["final_markdown"]
                     print(f"   ✅ Ghostwriter completed!")
                     print(f"   📝 Length: {len(markdown):,} characters")
-                    print(f"   📄 Lines: {len(markdown.split(chr(10))):,}")
+                    print(f"   📄 Lines: {markdown.count(chr(10)) + 1:,}")
                     final_state = state
 
-        print("\n" + "─" * 70)
+        # With everything seeded the graph has no node left to run
+        if final_state is None and initial_state.get("analysis"):
+            final_state = initial_state
+
+        # The analysis graph ends after CTO, so the README is written from
+        # its final state - the pipeline still covers Ghostwriter
+        if (final_state and final_state.get("analysis")
+                and not final_state.get("final_markdown")):
+            print(f"\n✍️  Running Ghostwriter on the final state...")
+            state = GhostwriterAgent()(final_state)
+            if state.get("error"):
+                print(f"   ❌ Error: {state['error']}")
+            elif state.get("final_markdown"):
+                markdown = state["final_markdown"]
+                print(f"   ✅ Ghostwriter completed!")
+                print(f"   📝 Length: {len(markdown):,} characters")
+                print(f"   📄 Lines: {markdown.count(chr(10)) + 1:,}")
+                final_state = state
+
+        print("\n" + _DASH)
 
         if final_state and final_state.get("final_markdown"):
+            markdown = final_state["final_markdown"]
+            preview = markdown[:500]
+            truncated = len(markdown) > 500
+
             print_subsection("📊 Pipeline Results")
             print(f"Username:           @{final_state['username']}")
             print(
@@ -546,35 +706,34 @@ def test_complete_pipeline():
             print(
                 f"Grind Score:        {final_state['analysis']['grind_score']['score']} ({final_state['analysis']['grind_score']['label']})")
             print(
-                f"README Length:      {len(final_state['final_markdown']):,} chars")
+                f"README Length:      {len(markdown):,} chars")
             print(f"Tone:               {tone.title()}")
 
             # Show preview
-            markdown = final_state["final_markdown"]
-            print("\n" + "─" * 70)
+            print("\n" + _DASH)
             print("📝 Preview (first 500 chars):")
-            print("─" * 70)
-            print(markdown[:500])
-            if len(markdown) > 500:
+            print(_DASH)
+            print(preview)
+            if truncated:
                 print("...")
 
-            # Ask to see full
-            show_full = input(
-                "\n📄 Show full README? (y/n): ").strip().lower()
-            if show_full == 'y':
-                print("\n" + "=" * 70)
-                print("📝 FULL README.md")
-                print("=" * 70 + "\n")
-                print(markdown)
-                print("\n" + "=" * 70)
-
-            # Ask to save
-            save = input("\n💾 Save to file? (y/n): ").strip().lower()
-            if save == 'y':
-                filename = f"README_{username}.md"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(markdown)
-                print(f"✅ Saved to {filename}")
+            if interactive:
+                # Ask to see full
+                show_full = input(
+                    "\n📄 Show full README? (y/n): ").strip().lower()
+                if show_full == 'y':
+                    print("\n" + _EQ)
+                    print("📝 FULL README.md")
+                    print(_EQ + "\n")
+                    print(markdown)
+                    print("\n" + _EQ)
+
+                # Ask to save
+                save = input("\n💾 Save to file? (y/n): ").strip().lower()
+                if save == 'y':
+                    filename = f"README_{username}.md"
+                    Path(filename).write_bytes(markdown.encode("utf-8"))
+                    print(f"✅ Saved to {filename}")
 
             print("\n✅ Complete pipeline test passed!")
             return final_state
@@ -584,22 +743,20 @@ def test_complete_pipeline():
 
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
-def save_test_results_old(data: dict, username: str):
+def save_test_results_old(data: dict, username: str, timestamp: Optional[str] = None):
     """Save test results to JSON for inspection"""
     if not data:
         return
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"test_results_{username}_{timestamp}.json"
 
     try:
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        Path(filename).write_bytes(_json_bytes(data))
         print(f"\n💾 Test results saved to: {filename}")
     except Exception as e:
         print(f"\n⚠️  Could not save results: {e}")
@@ -607,14 +764,46 @@ def save_test_results_old(data: dict, username: str):
 
 def main():
     """Main test menu"""
-    print("=" * 70)
+    parser = argparse.ArgumentParser(description="GRWM agent testing suite")
+    parser.add_argument("--username", help="GitHub username to test (skips the prompt)")
+    parser.add_argument("--tone", choices=TONES, help="README tone (skips the prompt)")
+    parser.add_argument("--all", action="store_true",
+                        help="Run all tests once without prompts, then exit (requires --username)")
+    args = parser.parse_args()
+    if args.all and not args.username:
+        parser.error("--all requires --username")
+
+    # uvloop is optional - fall back to the default asyncio loop without it
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    print(_EQ)
     print("🧪 GRWM - Agent Testing Suite")
-    print("=" * 70)
+    print(_EQ)
 
     # Check environment
     if not check_environment():
-        return
+        sys.exit(1)
+
+    try:
+        if args.all:
+            passed = run_all_tests(args.username, args.tone, interactive=False)
+        else:
+            run_menu(args.username, args.tone)
+            passed = True
+    finally:
+        close_detective()
+        close_loop()
+
+    if not passed:
+        sys.exit(1)
 
+
+def run_menu(username: Optional[str] = None, tone: Optional[str] = None):
+    """Interactive test menu loop (username / tone skip their prompts)"""
     # Test menu
     while True:
         print_section("🧪 Test Menu")
@@ -629,7 +818,7 @@ def main():
         choice = input("\n👉 Select option (1-7): ").strip()
 
         if choice == "1":
-            result = test_detective_standalone()
+            result = test_detective_standalone(username)
             if result:
                 save = input(
                     "\n💾 Save results to JSON? (y/n): ").strip().lower()
@@ -639,7 +828,7 @@ def main():
         elif choice == "2":
             # Need Detective data first
             print("\n⚠️  CTO requires Detective data. Running Detective first...")
-            detective_data = test_detective_standalone()
+            detective_data = test_detective_standalone(username)
             if detective_data:
                 result = test_cto_standalone(detective_data)
                 if result:
@@ -653,15 +842,15 @@ def main():
             # Need Detective + CTO data first
             print(
                 "\n⚠️  Ghostwriter requires Detective + CTO data. Running both first...")
-            detective_data = test_detective_standalone()
+            detective_data = test_detective_standalone(username)
             if detective_data:
                 cto_data = test_cto_standalone(detective_data)
                 if cto_data:
                     result = test_ghostwriter_standalone(
-                        detective_data, cto_data)
+                        detective_data, cto_data, tone=tone)
 
         elif choice == "4":
-            result = test_detective_with_graph()
+            result = run_async(test_detective_with_graph(username))
             if result and (result.get("raw_data") or result.get("analysis")):
                 save = input(
                     "\n💾 Save results to JSON? (y/n): ").strip().lower()
@@ -669,7 +858,8 @@ def main():
                     save_test_results(result, result['username'])
 
         elif choice == "5":
-            result = test_complete_pipeline()
+            result = run_async(test_complete_pipeline(
+                username=username, tone=tone))
             if result:
                 save = input(
                     "\n💾 Save complete results to JSON? (y/n): ").strip().lower()
@@ -677,43 +867,7 @@ def main():
                     save_test_results(result, result['username'])
 
         elif choice == "6":
-            username = input("\n👤 Enter GitHub username: ").strip()
-            if username:
-                # Detective standalone
-                print("\n" + "=" * 70)
-                print("TEST 1: Detective Standalone")
-                print("=" * 70)
-                result1 = test_detective_standalone()
-
-                # CTO standalone (if Detective succeeded)
-                result2 = None
-                if result1:
-                    print("\n" + "=" * 70)
-                    print("TEST 2: CTO Standalone")
-                    print("=" * 70)
-                    result2 = test_cto_standalone(result1)
-
-                # Ghostwriter standalone (if CTO succeeded)
-                result3 = None
-                if result2:
-                    print("\n" + "=" * 70)
-                    print("TEST 3: Ghostwriter Standalone")
-                    print("=" * 70)
-                    result3 = test_ghostwriter_standalone(result1, result2)
-
-                # Complete pipeline test
-                print("\n" + "=" * 70)
-                print("TEST 4: Complete Pipeline (LangGraph)")
-                print("=" * 70)
-                result4 = test_complete_pipeline()
-
-                # Save if all successful
-                if result1 and result2 and result3 and result4:
-                    save = input(
-                        "\n💾 Save all results to JSON? (y/n): ").strip().lower()
-                    if save == "y":
-                        save_test_results(
-                            {"detective": result1, "cto": result2, "ghostwriter": result3, "complete_pipeline": result4}, username)
+            run_all_tests(username, tone)
 
         elif choice == "7":
             print("\n👋 Goodbye!")
@@ -723,5 +877,74 @@ def main():
             print("❌ Invalid choice")
 
 
+def run_all_tests(username: Optional[str] = None, tone: Optional[str] = None,
+                  interactive: bool = True) -> bool:
+    """
+    Run every test for one user (menu option 6 / --all)
+    With interactive=False nothing is prompted for and nothing is saved
+    Returns True if all tests passed
+    """
+    if username is None:
+        username = input("\n👤 Enter GitHub username: ").strip()
+    if not username:
+        return False
+
+    # One timestamp for the whole batch so its saves share a stem
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # Detective standalone
+    print("\n" + _EQ)
+    print("TEST 1: Detective Standalone")
+    print(_EQ)
+    result1 = test_detective_standalone(username)
+
+    # CTO standalone (if Detective succeeded)
+    result2 = None
+    if result1:
+        print("\n" + _EQ)
+        print("TEST 2: CTO Standalone")
+        print(_EQ)
+        result2 = test_cto_standalone(result1)
+
+    # Tone is asked once for both README-writing tests
+    if tone is None:
+        tone = select_tone() if interactive else "professional"
+
+    # Ghostwriter standalone (if CTO succeeded)
+    result3 = None
+    if result2:
+        print("\n" + _EQ)
+        print("TEST 3: Ghostwriter Standalone")
+        print(_EQ)
+        result3 = test_ghostwriter_standalone(
+            result1, result2, tone=tone, interactive=interactive)
+
+    # Complete pipeline test
+    print("\n" + _EQ)
+    print("TEST 4: Complete Pipeline (LangGraph)")
+    print(_EQ)
+    # Reuse the Detective data and CTO analysis so the graph doesn't hit
+    # GitHub or re-run CTO (it re-runs CTO only if TEST 2 failed)
+    result4 = run_async(test_complete_pipeline(
+        raw_data=result1, analysis=result2, username=username, tone=tone,
+        interactive=interactive))
+
+    # Summary, so a failing --all run says which test broke
+    print_section("📋 TEST SUMMARY")
+    for name, result in (("Detective", result1), ("CTO", result2),
+                         ("Ghostwriter", result3), ("Complete Pipeline", result4)):
+        print(f"   {'✅' if result else '❌'} {name}")
+
+    # Save if all successful
+    passed = bool(result1 and result2 and result3 and result4)
+    if passed and interactive:
+        save = input(
+            "\n💾 Save all results to JSON? (y/n): ").strip().lower()
+        if save == "y":
+            save_test_results(
+                {"detective": result1, "cto": result2, "ghostwriter": result3, "complete_pipeline": result4}, username, timestamp)
+    return passed
+
+
 if __name__ == "__main__":
     main()